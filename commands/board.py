@@ -140,7 +140,7 @@ class CmdBoard(MuxCommand):
                 
                 # Format post
                 header = f"|wPost {post_num} on {board.key}|n"
-                if hasattr(post, 'pinned') and post.pinned:
+                if post.is_pinned:
                     header = f"|y[PINNED]|n {header}"
                 divider = "-" * len(header)
                 caller.msg(f"{header}\n{divider}")
@@ -183,7 +183,7 @@ class CmdBoard(MuxCommand):
                     marker = "|g*|n " if is_unread else "  "
                     date = post.date_created.strftime("%Y-%m-%d")
                     flags = []
-                    if hasattr(post, 'pinned') and post.pinned:
+                    if post.is_pinned:
                         flags.append("|y[P]|n")
                     if hasattr(post, 'last_edited') and post.last_edited:
                         flags.append("|w[E]|n")
@@ -435,7 +435,7 @@ class CmdBoard(MuxCommand):
             for board, post in results:
                 date = post.date_created.strftime("%Y-%m-%d")
                 flags = []
-                if hasattr(post, 'pinned') and post.pinned:
+                if post.is_pinned:
                     flags.append("|y[P]|n")
                 if hasattr(post, 'last_edited') and post.last_edited:
                     flags.append("|w[E]|n")
@@ -349,21 +349,50 @@ class CmdBiography(CharacterLookupMixin, MuxCommand):
             return
         self.show_biography(char)
             
+    def get_biography(self, char):
+        """
+        Collect the values shown in a character's biography.
+        
+        Args:
+            char: The character to read
+            
+        Returns:
+            dict: Biography fields keyed by name. Distinction entries are
+                traits or None, and are omitted from the display entirely
+                when has_distinctions is False.
+        """
+        has_distinctions = hasattr(char, 'distinctions')
+        return {
+            "full_name": char.db.full_name,
+            # Get the character's description using Evennia's built-in method
+            "description": char.get_display_desc(self.caller),
+            "has_distinctions": has_distinctions,
+            "concept": char.distinctions.get("concept") if has_distinctions else None,
+            "culture": char.distinctions.get("culture") if has_distinctions else None,
+            "vocation": char.distinctions.get("vocation") if has_distinctions else None,
+            "gender": char.db.gender,
+            "age": char.db.age,
+            "birthday": char.db.birthday,
+            "realm": char.db.realm,
+            "background": char.db.background,
+            "personality": char.db.personality,
+            "notable_traits": char.db.notable_traits,
+        }
+            
     def show_biography(self, char):
         """Show a character's biography."""
-        # Get the character's description using Evennia's built-in method
-        desc = char.get_display_desc(self.caller)
+        bio = self.get_biography(char)
         
         # Build the biography message
         msg = f"\n|w{char.name}'s Biography|n"
         
         # Add full name if it exists
-        if char.db.full_name:
-            msg += f"\n|wFull Name:|n {char.db.full_name}"
+        if bio["full_name"]:
+            msg += f"\n|wFull Name:|n {bio['full_name']}"
         
         # Add character concept first if it exists
-        if hasattr(char, 'distinctions'):
-            concept = char.distinctions.get("concept")
+        if bio["has_distinctions"]:
+            concept = bio["concept"]
             if concept:
                 msg += f"\n|wConcept:|n {concept.name}"
                 if concept.desc:
@@ -374,28 +403,28 @@ class CmdBiography(CharacterLookupMixin, MuxCommand):
         # Add demographic information on one line
         msg += "\n"
         demographics = []
-        if char.db.gender:
-            demographics.append(f"|wGender:|n {char.db.gender}")
-        if char.db.age:
-            demographics.append(f"|wAge:|n {char.db.age}")
-        if char.db.birthday:
-            demographics.append(f"|wBirthday:|n {char.db.birthday}")
-        if char.db.realm:
-            demographics.append(f"|wRealm:|n {char.db.realm}")
+        if bio["gender"]:
+            demographics.append(f"|wGender:|n {bio['gender']}")
+        if bio["age"]:
+            demographics.append(f"|wAge:|n {bio['age']}")
+        if bio["birthday"]:
+            demographics.append(f"|wBirthday:|n {bio['birthday']}")
+        if bio["realm"]:
+            demographics.append(f"|wRealm:|n {bio['realm']}")
         msg += " | ".join(demographics) if demographics else "|wNo demographics set|n"
         
         # Add culture and vocation on one line if they exist
-        if hasattr(char, 'distinctions'):
-            culture = char.distinctions.get("culture")
-            vocation = char.distinctions.get("vocation")
+        if bio["has_distinctions"]:
+            culture = bio["culture"]
+            vocation = bio["vocation"]
             culture_text = f"|wCulture:|n {culture.name}" if culture else "|wCulture:|n Not set"
             vocation_text = f"|wVocation:|n {vocation.name}" if vocation else "|wVocation:|n Not set"
             msg += f"\n{culture_text} | {vocation_text}"
         
         # Add main character information
-        msg += f"\n\n|wDescription:|n\n{desc}"
-        msg += f"\n\n|wBackground:|n\n{char.db.background}"
-        msg += f"\n\n|wPersonality:|n\n{char.db.personality}"
+        msg += f"\n\n|wDescription:|n\n{bio['description']}"
+        msg += f"\n\n|wBackground:|n\n{bio['background']}"
+        msg += f"\n\n|wPersonality:|n\n{bio['personality']}"
         
         # Add organization memberships
         orgs = char.organisations
@@ -420,8 +449,8 @@ class CmdBiography(CharacterLookupMixin, MuxCommand):
             msg += f"\n{str(table)}"
         
         # Add notable traits if they exist
-        if char.db.notable_traits:
-            msg += f"\n\n|wNotable Traits:|n\n{char.db.notable_traits}"
+        if bio["notable_traits"]:
+            msg += f"\n\n|wNotable Traits:|n\n{bio['notable_traits']}"
         
         self.msg(msg)
 
@@ -20,6 +20,7 @@ from collections import defaultdict
 # Constants for validation
 MAX_DICE_POOL = 10  # Maximum number of dice that can be rolled at once
 VALID_DIE_SIZES = {'4', '6', '8', '10', '12'}  # Set for O(1) lookup
+DIFFICULTY_LOOKUP = {name.lower(): value for name, value in DIFFICULTIES.items()}  # Exact-match lookup by lowercase name
 
 def format_colored_roll(value, die, trait_info, extra_value=None):
     """
@@ -197,15 +198,9 @@ class CmdCortexRoll(Command):
                     self.difficulty = int(diff_val)
                 except ValueError:
                     # Try to match named difficulty exactly first
-                    exact_match = None
+                    exact_match = DIFFICULTY_LOOKUP.get(diff_val)
                     partial_matches = []
                     
-                    # First check for exact matches
-                    for name, value in DIFFICULTIES.items():
-                        if diff_val == name.lower():
-                            exact_match = value
-                            break
-                    
                     if exact_match is not None:
                         self.difficulty = exact_match
                     else:
@@ -134,9 +134,9 @@ class CmdRoomManagement(CharacterLookupMixin, MuxCommand):
                 return
                 
             if org_owners:
-                self.msg("Organization owners: " + list_to_string([name for id, name in org_owners.items()]))
+                self.msg("Organization owners: " + list_to_string(list(org_owners.values())))
             if char_owners:
-                self.msg("Character owners: " + list_to_string([char.name for id, char in char_owners.items()]))
+                self.msg("Character owners: " + list_to_string([char.name for char in char_owners.values()]))
                 
         elif switch in ["givekey", "removekey"]:
             if not self.args:
@@ -29,6 +29,33 @@ lock functions from evennia.locks.lockfuncs.
 #    print "%s tried to access %s. Access denied." % (accessing_obj, accessed_obj)
 #    return False
 
+def _find_org_id(character, org_name):
+    """
+    Resolve an organisation name to its id, caching the organisation found on
+    the character's ndb so repeated lock checks skip the search. There is no
+    expiry time: a cached organisation is reused only while it still exists
+    under that name (the idmapper keeps one shared instance, so deletes and
+    renames show up on it), and misses are not cached, so an organisation
+    created after a failed check is found on the next one.
+    Membership itself is not cached - character.organisations already is.
+    """
+    cache = character.ndb.orgmember_cache
+    if cache is None:
+        cache = {}
+        character.ndb.orgmember_cache = cache
+    
+    org = cache.get(org_name)
+    if org is not None and org.pk and org.key.lower() == org_name.lower():
+        return org.id
+    
+    from evennia.utils.search import search_object
+    orgs = search_object(org_name, typeclass='typeclasses.organisations.Organisation')
+    if not orgs:
+        cache.pop(org_name, None)
+        return None
+    cache[org_name] = orgs[0]
+    return orgs[0].id
+
 def orgmember(accessing_obj, accessed_obj, *args, **kwargs):
     """
     Check if accessing_obj is a member of the specified organization and optionally has minimum rank.
@@ -43,25 +70,20 @@ def orgmember(accessing_obj, accessed_obj, *args, **kwargs):
     org_name = args[0]
     min_rank = int(args[1]) if len(args) > 1 else 10
     
-    # Get the character if an account is accessing
-    character = accessing_obj
-    if hasattr(accessing_obj, 'character'):
-        character = accessing_obj.character
+    # Get the character if an account is accessing; an account with no
+    # puppet can never be a member, so skip the org search entirely
+    character = getattr(accessing_obj, 'character', accessing_obj)
+    if character is None:
+        return False
     
     # Find the organization by name
-    from evennia.utils.search import search_object
-    orgs = search_object(org_name, typeclass='typeclasses.organisations.Organisation')
-    if not orgs:
+    org_id = _find_org_id(character, org_name)
+    if org_id is None:
         return False
-    org = orgs[0]
     
     # Get the character's organisations and check membership by org ID
-    char_orgs = character.organisations
-    if org.id in char_orgs:
-        rank = char_orgs[org.id]
-        return rank <= min_rank
-    
-    return False
+    rank = character.organisations.get(org_id)
+    return rank is not None and rank <= min_rank
 
 def roomaccess(accessing_obj, accessed_obj, *args, **kwargs):
     """
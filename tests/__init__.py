@@ -1,3 +1,18 @@
 """
 Test suite for Empire MUD
-""" 
\ No newline at end of file
+
+Run from the game directory with Evennia's test runner:
+
+    evennia test --settings settings.py tests
+
+Test classes share no state, so they can be spread over worker processes
+with Django's parallel runner, which gives each worker its own copy of the
+test database:
+
+    evennia test --settings settings.py --parallel auto tests
+
+To find slow tests, Django 5.0 and later (Evennia 5 and later) running on
+Python 3.12 or newer can list the slowest ones after the run:
+
+    evennia test --settings settings.py --durations 20 tests.test_charsheet_editor
+"""
@@ -0,0 +1,122 @@
+"""
+Tests for the bulletin board system.
+"""
+
+from collections.abc import MutableSet
+from datetime import datetime, timedelta, timezone
+from evennia.utils.test_resources import EvenniaTest
+from evennia import create_script, create_message
+from typeclasses.boards import BulletinBoardScript
+
+# Creation time of the first fixture post; later posts are a minute apart so
+# newest-first ordering never depends on how fast the test runs
+POST_TIME = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+class TestBoards(EvenniaTest):
+    """Test cases for bulletin board functionality."""
+
+    def setUp(self):
+        """Set up test case."""
+        super().setUp()
+        self.board = create_script(BulletinBoardScript, key="Test Board")
+        
+        # Give admin permissions for pinning
+        self.char1.permissions.add("Admin")
+
+    def _post(self, title, minutes, board=None):
+        """Post as char1, dated the given number of minutes after POST_TIME."""
+        post = (board or self.board).create_post(self.char1, title, f"{title} text")
+        post.db_date_created = POST_TIME + timedelta(minutes=minutes)
+        post.save()
+        return post
+
+    def test_archive_oldest_unpinned(self):
+        """Test that going over max_posts archives the oldest unpinned post."""
+        self.board.db.max_posts = 3
+        oldest = self._post("Oldest", 0)
+        second = self._post("Second", 1)
+        third = self._post("Third", 2)
+        self.board.pin_post(self.char1, oldest)
+        self.assertTrue(oldest.tags.has("pinned", category="board_messages"))
+
+        # The fourth post takes the board over max_posts
+        newest = self.board.create_post(self.char1, "Newest", "Newest text")
+
+        # The pinned post is skipped, so the next oldest is archived
+        self.assertTrue(second.tags.has("archived", category="board_messages"))
+        for post in (oldest, third, newest):
+            self.assertFalse(post.tags.has("archived", category="board_messages"))
+
+    def test_get_posts(self):
+        """Test that get_posts lists this board's posts, newest first."""
+        first = self._post("First", 0)
+        second = self._post("Second", 1)
+        
+        # Neither another board's posts nor untagged messages are listed
+        other_board = create_script(BulletinBoardScript, key="Other Board")
+        self._post("Elsewhere", 2, board=other_board)
+        create_message(senderobj=self.char1, message="Not a post", receivers=self.board)
+        
+        posts = [post for post, _ in self.board.get_posts(self.char1)]
+        self.assertEqual(posts, [second, first])
+
+    def test_pinned_posts_first(self):
+        """Test that pinned posts are listed before newer unpinned ones."""
+        older = self._post("Older", 0)
+        newer = self._post("Newer", 1)
+        self.board.pin_post(self.char1, older)
+        
+        posts = self.board.get_posts(self.char1)
+        self.assertEqual([post for post, _ in posts], [older, newer])
+        self.assertEqual([post.is_pinned for post, _ in posts], [True, False])
+
+    def test_archived_posts(self):
+        """Test that archived posts are only listed on request."""
+        live = self._post("Live", 0)
+        archived = self._post("Archived", 1)
+        archived.tags.add("archived", category="board_messages")
+        
+        posts = [post for post, _ in self.board.get_posts(self.char1)]
+        self.assertEqual(posts, [live])
+        posts = [post for post, _ in self.board.get_posts(self.char1, include_archived=True)]
+        self.assertEqual(posts, [archived, live])
+
+    def test_mark_read(self):
+        """Test that marking a post read clears its unread flag."""
+        post = self._post("Post", 0)
+        self.assertEqual(self.board.get_posts(self.char2), [(post, True)])
+        
+        self.board.mark_read(self.char2, post)
+        self.assertEqual(self.board.get_posts(self.char2), [(post, False)])
+        # Other readers still see it as unread
+        self.assertEqual(self.board.get_posts(self.char1), [(post, True)])
+
+    def test_edit_and_delete_permissions(self):
+        """Test that only the poster can edit or delete a post."""
+        post = self._post("Post", 0)
+        
+        # Test someone else editing and deleting
+        self.assertFalse(self.board.edit_post(self.char2, post, "Changed"))
+        self.assertEqual(post.message, "Post text")
+        self.assertFalse(self.board.delete_post(self.char2, post))
+        self.assertEqual(self.board.get_posts(self.char1), [(post, True)])
+        
+        # Test the poster editing and deleting
+        self.assertTrue(self.board.edit_post(self.char1, post, "Changed"))
+        self.assertEqual(post.message, "Changed")
+        self.assertEqual(post.edited_by, self.char1)
+        self.assertTrue(self.board.delete_post(self.char1, post))
+        self.assertEqual(self.board.get_posts(self.char1), [])
+
+    def test_subscribe_converts_list(self):
+        """Test that subscribing converts a legacy subscriber list to a set."""
+        self.board.db.subscribers = [self.char2]
+        
+        self.assertTrue(self.board.subscribe(self.char1))
+        subscribers = self.board.db.subscribers
+        self.assertIsInstance(subscribers, MutableSet)
+        self.assertEqual(set(subscribers), {self.char1, self.char2})
+        
+        # Subscribing again doesn't add a duplicate
+        self.assertTrue(self.board.subscribe(self.char1))
+        self.assertEqual(len(self.board.db.subscribers), 2)
@@ -2,7 +2,7 @@
 Tests for Cortex Prime game system utilities.
 """
 
-from evennia.utils.test_resources import EvenniaTest
+from unittest import TestCase
 from utils.cortex import (
     DIFFICULTIES,
     DIE_SIZES,
@@ -14,41 +14,53 @@ from utils.cortex import (
     validate_dice_pool
 )
 
-class TestCortexUtils(EvenniaTest):
+# step_die cases: (die size, steps, expected die size)
+STEP_DIE_CASES = (
+    # Stepping up
+    ("4", 1, "6"),
+    ("6", 1, "8"),
+    ("8", 1, "10"),
+    ("10", 1, "12"),
+    ("12", 1, "12"),  # Can't step up past d12
+    # Stepping down
+    ("12", -1, "10"),
+    ("10", -1, "8"),
+    ("8", -1, "6"),
+    ("6", -1, "4"),
+    ("4", -1, "4"),  # Can't step down past d4
+    # Multiple steps
+    ("4", 2, "8"),
+    ("12", -2, "8"),
+    # Invalid die sizes
+    ("5", 1, "5"),  # Invalid die returns unchanged
+    ("", 1, ""),  # Empty string returns unchanged
+)
+
+# Dice for the pool validation tests
+ATTRIBUTE_DIE = TraitDie("8", "character_attributes", "strength", None)
+SKILL_DIE = TraitDie("6", "skills", "fighting", None)
+DISTINCTION_DIE = TraitDie("8", "distinctions", "warrior", None)
+ASSET_DIE = TraitDie("6", "signature_assets", "sword", None)
+RAW_DIE = TraitDie("8", None, None, None)
+
+class TestCortexUtils(TestCase):
     """Test cases for Cortex utility functions."""
     
     def test_step_die(self):
         """Test stepping dice up and down."""
-        # Test stepping up
-        self.assertEqual(step_die("4", 1), "6")
-        self.assertEqual(step_die("6", 1), "8")
-        self.assertEqual(step_die("8", 1), "10")
-        self.assertEqual(step_die("10", 1), "12")
-        self.assertEqual(step_die("12", 1), "12")  # Can't step up past d12
-        
-        # Test stepping down
-        self.assertEqual(step_die("12", -1), "10")
-        self.assertEqual(step_die("10", -1), "8")
-        self.assertEqual(step_die("8", -1), "6")
-        self.assertEqual(step_die("6", -1), "4")
-        self.assertEqual(step_die("4", -1), "4")  # Can't step down past d4
-        
-        # Test multiple steps
-        self.assertEqual(step_die("4", 2), "8")
-        self.assertEqual(step_die("12", -2), "8")
-         # Test invalid die sizes
-        self.assertEqual(step_die("5", 1), "5")  # Invalid die returns unchanged
-        self.assertEqual(step_die("", 1), "")  # Empty string returns unchanged
+        for die_size, steps, expected in STEP_DIE_CASES:
+            with self.subTest(die_size=die_size, steps=steps):
+                self.assertEqual(step_die(die_size, steps), expected)
     
     def test_roll_die(self):
         """Test die rolling."""
         # Test range for each die size
         for sides in [4, 6, 8, 10, 12]:
-            # Roll multiple times to ensure we get valid results
-            for _ in range(100):
-                result = roll_die(sides)
-                self.assertGreaterEqual(result, 1)
-                self.assertLessEqual(result, sides)
+            with self.subTest(sides=sides):
+                # Roll multiple times to ensure we get valid results
+                results = [roll_die(sides) for _ in range(100)]
+                self.assertGreaterEqual(min(results), 1)
+                self.assertLessEqual(max(results), sides)
                 
     def test_process_results(self):
         """Test processing of dice roll results."""
@@ -117,20 +129,14 @@ class TestCortexUtils(EvenniaTest):
     
     def test_validate_dice_pool(self):
         """Test dice pool validation."""
-        # Create some test dice
-        attribute = TraitDie("8", "character_attributes", "strength", None)
-        skill = TraitDie("6", "skills", "fighting", None)
-        distinction = TraitDie("8", "distinctions", "warrior", None)
-        asset = TraitDie("6", "signature_assets", "sword", None)
-        raw_die = TraitDie("8", None, None, None)
-        
         # Test valid pools
-        self.assertIsNone(validate_dice_pool([raw_die]))  # Single raw die is valid
-        self.assertIsNone(validate_dice_pool([raw_die, raw_die]))  # Multiple raw dice are valid
-        self.assertIsNone(validate_dice_pool([attribute, skill, distinction]))  # Complete prime set        self.assertIsNone(validate_dice_pool([attribute, skill, distinction, asset]))  # Prime set with asset
+        self.assertIsNone(validate_dice_pool([RAW_DIE]))  # Single raw die is valid
+        self.assertIsNone(validate_dice_pool([RAW_DIE, RAW_DIE]))  # Multiple raw dice are valid
+        self.assertIsNone(validate_dice_pool([ATTRIBUTE_DIE, SKILL_DIE, DISTINCTION_DIE]))  # Complete prime set
+        self.assertIsNone(validate_dice_pool([ATTRIBUTE_DIE, SKILL_DIE, DISTINCTION_DIE, ASSET_DIE]))  # Prime set with asset
         
         # Test invalid pools
-        self.assertIsNotNone(validate_dice_pool([attribute]))  # Missing skill and distinction
-        self.assertIsNotNone(validate_dice_pool([attribute, skill]))  # Missing distinction
-        self.assertIsNotNone(validate_dice_pool([asset]))  # Asset without prime set
-        self.assertIsNotNone(validate_dice_pool([attribute, distinction, asset]))  # Missing skill
\ No newline at end of file
+        self.assertIsNotNone(validate_dice_pool([ATTRIBUTE_DIE]))  # Missing skill and distinction
+        self.assertIsNotNone(validate_dice_pool([ATTRIBUTE_DIE, SKILL_DIE]))  # Missing distinction
+        self.assertIsNotNone(validate_dice_pool([ASSET_DIE]))  # Asset without prime set
+        self.assertIsNotNone(validate_dice_pool([ATTRIBUTE_DIE, DISTINCTION_DIE, ASSET_DIE]))  # Missing skill
\ No newline at end of file
@@ -5,20 +5,23 @@ Tests for the organization system.
 from unittest.mock import MagicMock, patch
 from evennia.utils.test_resources import EvenniaTest
 from commands.organisations import CmdOrg, CmdResource
-from typeclasses.organisations import Organisation
+from typeclasses.organisations import Organisation, DEFAULT_RANK_NAMES
 from evennia import create_object
+from server.conf.lockfuncs import orgmember
 from utils.org_utils import validate_rank, parse_equals, parse_comma, get_org, get_char, get_org_and_char
 import unittest
 
-class TestOrganisation(EvenniaTest):
-    """Test cases for organization functionality."""
+class _BaseOrgTest(EvenniaTest):
+    """Shared fixture for organisation command tests: a command and a test house."""
+    
+    cmd_class = None  # Command under test, set by subclasses
     
     def setUp(self):
         """Set up test case."""
         super().setUp()
         
         # Set up command
-        self.cmd = CmdOrg()
+        self.cmd = self.cmd_class()
         self.cmd.caller = self.char1
         self.cmd.obj = self.char1
         self.cmd.session = self.session
@@ -35,18 +38,7 @@ class TestOrganisation(EvenniaTest):
         )
         self.org.db.description = "A test noble house"
         self.org.db.members = {}  # Initialize empty members dict
-        self.org.db.rank_names = {  # Initialize rank names
-            1: "Head of House",      
-            2: "Minister",        
-            3: "Noble Family",       
-            4: "Senior Servant",        
-            5: "Servant",         
-            6: "Junior Servant",        
-            7: "Affiliate",   
-            8: "Extended Family",      
-            9: "",       
-            10: ""     
-        }
+        self.org.db.rank_names = dict(DEFAULT_RANK_NAMES)  # Initialize rank names
         
         # Initialize command properties
         self.cmd.args = ""
@@ -57,11 +49,23 @@ class TestOrganisation(EvenniaTest):
         # Give admin permissions for staff-only actions
         self.caller.permissions.add("Admin")
         
-        # Add helper methods to command
-        self.cmd._validate_rank = lambda rank_str, default=None: validate_rank(rank_str, default, self.caller)
+        # Add helper methods shared by the organisation commands
         self.cmd._parse_equals = lambda usage_msg: parse_equals(self.cmd.args)
         self.cmd._parse_comma = lambda text, expected_parts=2, usage_msg=None: parse_comma(text, expected_parts)
         self.cmd._get_org = lambda org_name: get_org(org_name, self.caller)
+
+
+class TestOrganisation(_BaseOrgTest):
+    """Test cases for organization functionality."""
+    
+    cmd_class = CmdOrg
+    
+    def setUp(self):
+        """Set up test case."""
+        super().setUp()
+        
+        # Add helper methods to command
+        self.cmd._validate_rank = lambda rank_str, default=None: validate_rank(rank_str, default, self.caller)
         self.cmd._get_character = lambda char_name: get_char(char_name, self.caller)
         self.cmd._get_org_and_char = lambda org_name, char_name: get_org_and_char(org_name, char_name, self.caller)
         
@@ -224,59 +228,40 @@ class TestOrganisation(EvenniaTest):
         
         # Verify organization was deleted
         self.assertFalse(Organisation.objects.filter(db_key="Test House").exists())
+        
+    def test_orgmember_lock(self):
+        """Test the orgmember lock function."""
+        self.org.add_member(self.char1, 4)
+        
+        # Test member with the default and an exactly matching minimum rank
+        self.assertTrue(orgmember(self.char1, None, "Test House"))
+        self.assertTrue(orgmember(self.char1, None, "Test House", "4"))
+        
+        # Test member without the required rank
+        self.assertFalse(orgmember(self.char1, None, "Test House", "3"))
+        
+        # Test non-member
+        self.assertFalse(orgmember(self.char2, None, "Test House"))
+        
+        # Test unknown organisation
+        self.assertFalse(orgmember(self.char1, None, "New House"))
+        
+        # The failed lookup isn't cached, so a new organisation is found at once
+        new_org = create_object(typeclass=Organisation, key="New House")
+        new_org.add_member(self.char1, 2)
+        self.assertTrue(orgmember(self.char1, None, "New House"))
 
 
-class TestResource(EvenniaTest):
+class TestResource(_BaseOrgTest):
     """Test cases for organization resources."""
     
+    cmd_class = CmdResource
+    
     def setUp(self):
         """Set up test case."""
         super().setUp()
         
-        # Set up command
-        self.cmd = CmdResource()
-        self.cmd.caller = self.char1
-        self.cmd.obj = self.char1
-        self.cmd.session = self.session
-        
-        # Set up message mocking
-        self.caller = self.char1
-        self.caller.msg = MagicMock()
-        self.cmd.msg = self.caller.msg
-        
-        # Create a test organization
-        self.org = create_object(
-            typeclass=Organisation,
-            key="Test House"
-        )
-        self.org.db.description = "A test noble house"
-        self.org.db.members = {}  # Initialize empty members dict
-        self.org.db.rank_names = {  # Initialize rank names
-            1: "Head of House",      
-            2: "Minister",        
-            3: "Noble Family",       
-            4: "Senior Servant",        
-            5: "Servant",         
-            6: "Junior Servant",        
-            7: "Affiliate",   
-            8: "Extended Family",      
-            9: "",       
-            10: ""     
-        }
-        
-        # Initialize command properties
-        self.cmd.args = ""
-        self.cmd.switches = []
-        self.cmd.lhs = ""
-        self.cmd.rhs = ""
-        
-        # Give admin permissions for staff-only actions
-        self.caller.permissions.add("Admin")
-        
         # Add helper methods to command
-        self.cmd._parse_equals = lambda usage_msg: parse_equals(self.cmd.args)
-        self.cmd._parse_comma = lambda text, expected_parts=2, usage_msg=None: parse_comma(text, expected_parts)
-        self.cmd._get_org = lambda org_name: get_org(org_name, self.caller)
         self.cmd._get_char = lambda char_name: get_char(char_name, self.caller, check_resources=True)
         
     def test_resource_creation(self):
@@ -0,0 +1,27 @@
+"""
+Tests for resource utility functions.
+"""
+
+from types import SimpleNamespace
+from unittest import TestCase
+from utils.resource_utils import get_unique_resource_name, validate_resource_owner
+
+class TestResourceUtils(TestCase):
+    """Test cases for resource utility functions."""
+    
+    def test_get_unique_resource_name(self):
+        """Test unique name generation."""
+        existing = {"gold": 6, "supplies": 4}
+        
+        # Test unique name generation
+        self.assertEqual(get_unique_resource_name("gold", existing), "gold_1")  # Since "gold" exists
+        
+        # Test unique name for new resource
+        self.assertEqual(get_unique_resource_name("new", existing), "new")  # Should use original name
+    
+    def test_validate_resource_owner(self):
+        """Test resource owner validation."""
+        # Regular object without resources
+        self.assertFalse(validate_resource_owner(SimpleNamespace(name="Thing")))
+        self.assertTrue(validate_resource_owner(SimpleNamespace(name="Char", char_resources={})))
+        self.assertTrue(validate_resource_owner(SimpleNamespace(name="Org", org_resources={})))
@@ -2,16 +2,29 @@
 Tests for resource system functionality.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 from evennia.utils.test_resources import EvenniaTest
 from commands.organisations import CmdResource
-from utils.resource_utils import get_unique_resource_name, validate_resource_owner
-from utils.org_utils import get_org, get_char
-from typeclasses.characters import Character
 from typeclasses.organisations import Organisation
-from evennia.contrib.rpg.traits import TraitHandler
 from evennia import create_object
 
+# Resources every test starts with: (key, name, die size)
+CHAR_RESOURCES = (
+    ("gold", "Gold", 6),
+    ("supplies", "Supplies", 4),
+)
+ORG_RESOURCES = (
+    ("armory", "Armory", 8),
+    ("treasury", "Treasury", 6),
+)
+
+# Resource creation cases: (switch, owner argument, test attribute holding
+# the owner, resource handler, new resource key)
+CREATE_RESOURCE_CASES = (
+    ("char", "self", "char1", "char_resources", "weapon"),
+    ("org", "Test Org", "org", "org_resources", "barracks"),
+)
+
 class TestResources(EvenniaTest):
     """Test cases for resource system functionality."""
     
@@ -30,10 +43,6 @@ class TestResources(EvenniaTest):
         # Set up command attributes
         self.cmd.switches = []
         
-        # Initialize trait handlers properly
-        if not hasattr(self.char1, 'char_resources'):
-            self.char1.char_resources = TraitHandler(self.char1, db_attribute_key="char_resources")
-        
         # Create and set up an organization
         self.org = self.create_organisation()
         
@@ -46,98 +55,68 @@ class TestResources(EvenniaTest):
     def create_organisation(self):
         """Create a test organization."""
         org = create_object(Organisation, key="Test Org")
-        if not hasattr(org, 'org_resources'):
-            org.org_resources = TraitHandler(org, db_attribute_key="org_resources")
         
-        # Add org resources
-        org.org_resources.add("armory", "Armory", trait_type="static", base=8)
-        org.org_resources.add("treasury", "Treasury", trait_type="static", base=6)
+        # Add org resources (org_resources is a lazy property on Organisation)
+        for key, name, base in ORG_RESOURCES:
+            org.org_resources.add(key, name, trait_type="static", base=base)
         
         return org
     
     def setup_char_resources(self):
         """Set up character resources."""
         # Add character resources
-        self.char1.char_resources.add("gold", "Gold", trait_type="static", base=6)
-        self.char1.char_resources.add("supplies", "Supplies", trait_type="static", base=4)
+        for key, name, base in CHAR_RESOURCES:
+            self.char1.char_resources.add(key, name, trait_type="static", base=base)
+    
+    def _run(self, switch, args):
+        """
+        Run the command with one switch (or none) on a fresh message mock and
+        return its last message as a string (tables are sent as EvTables).
+        """
+        self.cmd.msg.reset_mock()
+        self.cmd.switches = [switch] if switch else []
+        self.cmd.args = args
+        self.cmd.func()
+        return str(self.cmd.msg.call_args.args[0])
     
     def test_list_resources(self):
         """Test listing resources."""
         # Add test resources
-        self.cmd.switches = ["char"]
-        self.cmd.args = "self,armory=8"
-        self.cmd.func()
-        self.cmd.switches = ["char"]
-        self.cmd.args = "self,treasury=6"
-        self.cmd.func()
+        self._run("char", "self,armory=8")
+        self._run("char", "self,treasury=6")
         
         # Test listing resources (no args lists caller's resources)
-        self.cmd.switches = []
-        self.cmd.args = ""
-        self.cmd.func()
-        output = str(self.cmd.msg.mock_calls[-1][1][0])  # Convert EvTable to string
+        output = self._run(None, "")
         self.assertIn("armory", output)
         self.assertIn("treasury", output)
     
-    def test_create_char_resource(self):
-        """Test creating character resources."""
-        # Test creating with valid die size
-        self.cmd.switches = ["char"]
-        self.cmd.args = "self,weapon=8"  # Using correct format
-        self.cmd.func()
-        output = str(self.cmd.msg.mock_calls[-1][1][0])
-        self.assertIn("Added resource", output)
-        
-        # Verify resource was created
-        trait = self.char1.char_resources.get("weapon")
-        self.assertIsNotNone(trait)
-        self.assertEqual(int(trait.base), 8)
-        
-        # Test creating with invalid die size
-        self.cmd.switches = ["char"]
-        self.cmd.args = "self,invalid=7"  # Using correct format
-        self.cmd.func()
-        output = str(self.cmd.msg.mock_calls[-1][1][0])
-        self.assertIn("Die size must be", output)
-    
-    def test_create_org_resource(self):
-        """Test creating organization resources."""
-        # Test creating with valid die size
-        self.cmd.switches = ["org"]
-        self.cmd.args = "Test Org,barracks=8"  # Using correct format
-        self.cmd.func()
-        output = str(self.cmd.msg.mock_calls[-1][1][0])
-        self.assertIn("Added resource", output)
-        
-        # Verify resource was created
-        trait = self.org.org_resources.get("barracks")
-        self.assertIsNotNone(trait)
-        self.assertEqual(int(trait.base), 8)
-        
-        # Test creating with invalid die size
-        self.cmd.switches = ["org"]
-        self.cmd.args = "Test Org,invalid=7"  # Using correct format
-        self.cmd.func()
-        output = str(self.cmd.msg.mock_calls[-1][1][0])
-        self.assertIn("Die size must be", output)
+    def test_create_resource(self):
+        """Test creating character and organization resources."""
+        for switch, owner, holder, handler_name, key in CREATE_RESOURCE_CASES:
+            with self.subTest(switch=switch):
+                # Test creating with valid die size
+                output = self._run(switch, f"{owner},{key}=8")  # Using correct format
+                self.assertIn("Added resource", output)
+                
+                # Verify resource was created
+                trait = getattr(getattr(self, holder), handler_name).get(key)
+                self.assertIsNotNone(trait)
+                self.assertEqual(int(trait.base), 8)
+                
+                # Test creating with invalid die size
+                output = self._run(switch, f"{owner},invalid=7")  # Using correct format
+                self.assertIn("Die size must be", output)
     
     def test_transfer_resource(self):
         """Test transferring resources."""
         # Create test resource
-        self.cmd.switches = ["char"]
-        self.cmd.args = "self,armory=8"
-        self.cmd.func()
+        self._run("char", "self,armory=8")
         
-        # Create target character and initialize trait handler
+        # Target character (char_resources is a lazy property on Character)
         target = self.char2
-        if not hasattr(target, 'char_resources'):
-            target.char_resources = TraitHandler(target, db_attribute_key="char_resources")
         
         # Test transfer
-        self.cmd.switches = ["transfer"]
-        self.cmd.args = f"{self.char1.name}:armory = {target.name}"  # source:resource = target
-        self.cmd.func()
-        output = self.cmd.msg.mock_calls[-1][1][0]
+        output = self._run("transfer", f"{self.char1.name}:armory = {target.name}")  # source:resource = target
         self.assertIn("Transferred", output)
         
         # Verify transfer
@@ -147,34 +126,11 @@ class TestResources(EvenniaTest):
     def test_delete_resource(self):
         """Test deleting resources."""
         # Create test resource
-        self.cmd.switches = ["char"]
-        self.cmd.args = "self,armory=8"
-        self.cmd.func()
+        self._run("char", "self,armory=8")
         
         # Test deletion
-        self.cmd.switches = ["delete"]
-        self.cmd.args = f"{self.char1.name},armory"  # owner,resource format
-        self.cmd.func()
-        output = self.cmd.msg.mock_calls[-1][1][0]
+        output = self._run("delete", f"{self.char1.name},armory")  # owner,resource format
         self.assertIn("Deleted", output)
         
         # Verify deletion
         self.assertIsNone(self.char1.char_resources.get("armory"))
-    
-    def test_resource_utils(self):
-        """Test resource utility functions."""
-        # Test unique name generation
-        name = get_unique_resource_name("gold", self.char1.char_resources)
-        self.assertEqual(name, "gold_1")  # Since "gold" exists
-        
-        # Test unique name for new resource
-        name = get_unique_resource_name("new", self.char1.char_resources)
-        self.assertEqual(name, "new")  # Should use original name
-        
-        # Test resource owner validation
-        obj = self.obj1  # Regular object without resources
-        self.assertFalse(validate_resource_owner(obj))
-        self.assertTrue(validate_resource_owner(self.char1))
-
-if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
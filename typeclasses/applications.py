@@ -18,15 +18,17 @@ class Application(DefaultScript):
         self.interval = None  # Not a repeating script
         self.persistent = True
         
-        # Initialize storage attributes
-        self.db.email = ""
-        self.db.char_name = ""
-        self.db.app_text = ""
-        self.db.ip_address = ""
-        self.db.status = "pending"  # pending, approved, rejected
-        self.db.reviewer = None
-        self.db.review_notes = ""
-        self.db.review_date = None
+        # Initialize storage attributes (new ones, so batch_add can create them together)
+        self.attributes.batch_add(
+            ("email", ""),
+            ("char_name", ""),
+            ("app_text", ""),
+            ("ip_address", ""),
+            ("status", "pending"),  # pending, approved, rejected
+            ("reviewer", None),
+            ("review_notes", ""),
+            ("review_date", None),
+        )
         
     def approve(self, reviewer, notes=""):
         """
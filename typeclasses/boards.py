@@ -7,12 +7,24 @@ for reading and posting.
 """
 
 from evennia import DefaultScript
-from evennia import create_message, search_message
+from evennia import create_message
+from evennia.comms.models import Msg
+from django.db.models import Exists, OuterRef
 from evennia.utils.utils import make_iter
 from evennia.utils import logger
 from typing import Optional, List, Tuple
+from collections.abc import MutableSet
 from datetime import datetime
 
+
+def _is_poster(post, character):
+    """
+    Check if character sent post with a single query on the sender table,
+    instead of building post.senders from all three sender relations.
+    """
+    return post.db_sender_objects.filter(id=character.id).exists()
+
+
 class BulletinBoardScript(DefaultScript):
     """
     A bulletin board that can contain posts.
@@ -21,7 +33,7 @@ class BulletinBoardScript(DefaultScript):
     messages. Each board maintains its own access controls.
     
     Attributes:
-        subscribers (list): Characters subscribed to this board
+        subscribers (set): Characters subscribed to this board
         read_access (str): Lock string for who can read
         write_access (str): Lock string for who can write
         admin_access (str): Lock string for who can admin
@@ -31,8 +43,8 @@ class BulletinBoardScript(DefaultScript):
         """Called when script is first created."""
         super().at_script_creation()
         
-        # Initialize subscriber list
-        self.db.subscribers = []
+        # Initialize subscribers (a set, so membership checks don't scan)
+        self.db.subscribers = set()
         
         # Default locks - start with basic read access, other permissions can be customized per board
         self.locks.add("read:all();write:all();admin:perm(Admin)")
@@ -59,8 +71,13 @@ class BulletinBoardScript(DefaultScript):
         if not self.access(subscriber, "read"):
             return False
             
-        if subscriber not in self.db.subscribers:
-            self.db.subscribers.append(subscriber)
+        subscribers = self.db.subscribers
+        if not isinstance(subscribers, MutableSet):
+            # Boards created before subscribers became a set stored a list
+            self.db.subscribers = set(subscribers or [])
+            subscribers = self.db.subscribers
+        if subscriber not in subscribers:
+            subscribers.add(subscriber)
         return True
 
     def unsubscribe(self, subscriber):
@@ -131,16 +148,34 @@ class BulletinBoardScript(DefaultScript):
         
         # Check if we need to archive old posts
         if self.db.archive_posts and post:
-            posts = self.get_posts(poster, include_archived=False)
-            if len(posts) > self.db.max_posts:
-                # Archive oldest non-pinned post
-                for old_post, _ in reversed(posts):
-                    if not old_post.db.pinned:
-                        old_post.tags.add("archived", category="board_messages")
-                        break
+            posts = self._board_posts()
+            if posts.count() > self.db.max_posts:
+                # Archive oldest non-pinned post, picked out by the database
+                pinned = Msg.objects.get_by_tag("pinned", category="board_messages")
+                oldest = posts.exclude(id__in=pinned.values("id")).order_by("db_date_created").first()
+                if oldest:
+                    oldest.tags.add("archived", category="board_messages")
                         
         return post
 
+    def _board_posts(self, include_archived=False):
+        """
+        Query this board's posts.
+        
+        Args:
+            include_archived (bool): Whether to include archived posts
+            
+        Returns:
+            QuerySet: The board's posts, unordered
+        """
+        # Let the database pick out this board's posts by tag, rather than
+        # loading every message sent to the board and checking tags in Python
+        posts = Msg.objects.get_by_tag("board_post", category="board_messages").filter(db_receivers_scripts=self)
+        if not include_archived:
+            archived = Msg.objects.get_by_tag("archived", category="board_messages")
+            posts = posts.exclude(id__in=archived.values("id"))
+        return posts
+
     def edit_post(self, editor: "Character", post: "Msg", new_text: str) -> bool:
         """
         Edit an existing post.
@@ -154,13 +189,14 @@ class BulletinBoardScript(DefaultScript):
             True if edit was successful
         """
         # Check if user has permission to edit this post
-        if not (editor == post.senders[0] or self.access(editor, "admin")):
+        if not (_is_poster(post, editor) or self.access(editor, "admin")):
             return False
             
         # Update the message
         post.message = new_text
-        post.db.last_edited = datetime.now()
-        post.db.edited_by = editor
+        # Msg has no Attributes; kept on the cached instance like read_by
+        post.last_edited = datetime.now()
+        post.edited_by = editor
         return True
 
     def get_posts(self, reader: "Character", include_archived: bool = False) -> List[Tuple["Msg", bool]]:
@@ -177,28 +213,22 @@ class BulletinBoardScript(DefaultScript):
         if not self.access(reader, "read"):
             return []
             
-        # Get all messages where this board is a receiver
-        posts = search_message(receiver=self)
-        if not posts:
-            return []
+        # Pinned posts first, then newest first, sorted by the database. The
+        # annotation also gives each post an is_pinned flag for display.
+        pinned = Msg.objects.filter(
+            pk=OuterRef("pk"), db_tags__db_key="pinned", db_tags__db_category="board_messages"
+        )
+        posts = self._board_posts(include_archived).annotate(
+            is_pinned=Exists(pinned)
+        ).order_by("-is_pinned", "-db_date_created")
             
-        # Filter to only board posts and check if they're unread
+        # Pair each post with its unread state
         filtered_posts = []
         for post in posts:
-            # Check if it's a board post
-            if not post.tags.has("board_post", category="board_messages"):
-                continue
-                
-            # Skip archived posts unless explicitly included
-            if not include_archived and post.tags.has("archived", category="board_messages"):
-                continue
-                
             # Check if post is unread
-            is_unread = reader not in post.read_by if hasattr(post, "read_by") else True
+            is_unread = reader.id not in post.read_by if hasattr(post, "read_by") else True
             filtered_posts.append((post, is_unread))
             
-        # Sort by date, pinned posts first
-        filtered_posts.sort(key=lambda x: (not bool(getattr(x[0], 'pinned', False)), x[0].date_created), reverse=True)
         return filtered_posts
 
     def mark_read(self, reader: "Character", post: "Msg") -> None:
@@ -209,10 +239,10 @@ class BulletinBoardScript(DefaultScript):
             reader: The character marking the post
             post: The post to mark
         """
+        # read_by holds reader ids, so marking and checking are set lookups
         if not hasattr(post, "read_by"):
-            post.read_by = []
-        if reader not in post.read_by:
-            post.read_by.append(reader)
+            post.read_by = set()
+        post.read_by.add(reader.id)
 
     def delete_post(self, character: "Character", post: "Msg") -> bool:
         """
@@ -226,7 +256,7 @@ class BulletinBoardScript(DefaultScript):
             True if post was deleted successfully
         """
         # Check if user has permission to delete this post
-        if not (character == post.senders[0] or self.access(character, "admin")):
+        if not (_is_poster(post, character) or self.access(character, "admin")):
             return False
             
         if self in post.receivers:
@@ -253,7 +283,11 @@ class BulletinBoardScript(DefaultScript):
         if not self.access(character, "admin"):
             return False
             
-        post.db.pinned = pin
+        # Msg has no Attributes, so the pin is kept as a tag
+        if pin:
+            post.tags.add("pinned", category="board_messages")
+        else:
+            post.tags.remove("pinned", category="board_messages")
         return True
 
     def _notify_new_post(self, post: "Msg", poster: "Character") -> None:
@@ -139,50 +139,25 @@ class Character(ObjectParent, DefaultCharacter):
         # Initialize organization memberships
         self.attributes.add('organisations', {}, category='organisations')
 
-        # Initialize attributes
-        for trait in ATTRIBUTES:
-            existing = self.character_attributes.get(trait.key)
-            if existing:
-                existing.base = trait.default_value
-            else:
-                self.character_attributes.add(
-                    trait.key,
-                    value=trait.default_value,
-                    desc=trait.description,
-                    name=trait.name
-                )
-                # Ensure .base is set correctly
-                self.character_attributes.get(trait.key).base = trait.default_value
-
-        # Initialize skills
-        for trait in SKILLS:
-            existing = self.skills.get(trait.key)
-            if existing:
-                existing.base = trait.default_value
-            else:
-                self.skills.add(
-                    trait.key,
-                    value=trait.default_value,
-                    desc=trait.description,
-                    name=trait.name
-                )
-                # Ensure .base is set correctly
-                self.skills.get(trait.key).base = trait.default_value
-
-        # Initialize distinctions
-        for trait in DISTINCTIONS:
-            existing = self.distinctions.get(trait.key)
-            if existing:
-                existing.base = trait.default_value
-            else:
-                self.distinctions.add(
-                    trait.key,
-                    value=trait.default_value,
-                    desc=trait.description,
-                    name=trait.name
-                )
-                # Ensure .base is set correctly
-                self.distinctions.get(trait.key).base = trait.default_value
+        # Initialize attributes, skills and distinctions. Passing base to add()
+        # stores each new trait in a single write instead of adding it and
+        # then saving the handler again to correct .base.
+        for handler, definitions in (
+            (self.character_attributes, ATTRIBUTES),
+            (self.skills, SKILLS),
+            (self.distinctions, DISTINCTIONS),
+        ):
+            for trait in definitions:
+                existing = handler.get(trait.key)
+                if existing:
+                    existing.base = trait.default_value
+                else:
+                    handler.add(
+                        trait.key,
+                        base=trait.default_value,
+                        desc=trait.description,
+                        name=trait.name
+                    )
 
         # Initialize resources handler (will be initialized on first access)
         _ = self.char_resources
@@ -13,6 +13,20 @@ from evennia.contrib.rpg.traits import TraitHandler
 from utils.resource_utils import get_unique_resource_name, validate_die_size
 from evennia.objects.models import ObjectDB
 
+# Rank names given to new organisations (1-10); copy before storing
+DEFAULT_RANK_NAMES = {
+    1: "Head of House",
+    2: "Minister",
+    3: "Noble Family",
+    4: "Senior Servant",
+    5: "Servant",
+    6: "Junior Servant",
+    7: "Affiliate",
+    8: "Extended Family",
+    9: "",
+    10: ""
+}
+
 
 class Organisation(ObjectParent, DefaultObject):
     """
@@ -43,18 +57,7 @@ class Organisation(ObjectParent, DefaultObject):
         self.db.description = "No description set."
         
         # Initialize rank names (1-10)
-        self.db.rank_names = {
-            1: "Head of House",      
-            2: "Minister",        
-            3: "Noble Family",       
-            4: "Senior Servant",        
-            5: "Servant",         
-            6: "Junior Servant",        
-            7: "Affiliate",   
-            8: "Extended Family",      
-            9: "",       
-            10: ""     
-        }
+        self.db.rank_names = dict(DEFAULT_RANK_NAMES)
         
         # Initialize members dict {character_id: rank_number}
         self.db.members = {}
@@ -7,7 +7,6 @@ requests that staff can review and respond to.
 
 from evennia.scripts.scripts import DefaultScript
 from evennia.utils.utils import datetime_format
-from evennia.utils.search import search_script
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 
@@ -226,7 +225,7 @@ class Request(DefaultScript):
         Returns the number of requests that were migrated.
         """
         count = 0
-        for request in search_script("typeclasses.requests.Request"):
+        for request in cls.objects.all():
             if request.migrate_category():
                 count += 1
         return count 
@@ -370,7 +369,7 @@ class Request(DefaultScript):
         count = 0
         
         # Search for all requests
-        for request in search_script("typeclasses.requests.Request"):
+        for request in cls.objects.all():
             # Only delete if:
             # 1. Request is archived
             # 2. Archive date is older than cutoff
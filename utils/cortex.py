@@ -5,6 +5,7 @@ Cortex Prime game system utilities.
 from typing import List, Tuple, Optional, Dict, NamedTuple, Any
 from collections import defaultdict
 from random import randint
+from operator import itemgetter
 
 # Define difficulty ratings as constants
 DIFFICULTIES = {
@@ -202,21 +203,20 @@ def process_results(results, hitches=False):
     if not results:
         return 0, 0, []
         
-    # Sort results by value, highest first
-    sorted_results = sorted(results, key=lambda x: x[0], reverse=True)
-    
     # Find hitches (dice that rolled 1) and collect their die sizes
     hitch_dice_sizes = [die_size for value, die_size in results if value == 1]
     
-    # Filter out hitches from total calculation
-    non_hitch_results = [result for result in sorted_results if result[0] != 1]
+    # Filter out hitches from total calculation, then sort the rest by
+    # value, highest first
+    non_hitch_results = sorted(
+        (result for result in results if result[0] != 1),
+        key=itemgetter(0),
+        reverse=True
+    )
     
     # Calculate total from two highest non-hitch dice
     if len(non_hitch_results) >= 2:
         total = non_hitch_results[0][0] + non_hitch_results[1][0]
-        # Get the die sizes used for the final result (two highest non-hitch)
-        used_dice = non_hitch_results[:2]
-        used_die_sizes = [die_size for value, die_size in used_dice]
         
         # Find unused dice (excluding hitches)
         unused_dice = non_hitch_results[2:]  # All non-hitch dice after the first two
@@ -4,6 +4,9 @@ Resource utility functions.
 
 import re
 
+# Trailing "_2" / " 2" style counters on resource names
+NUMBER_SUFFIX_REGEX = re.compile(r'[_\s]+\d+$')
+
 
 def get_unique_resource_name(name, existing_resources, caller=None):
     """Get a unique name for a resource, appending a number if needed.
@@ -17,7 +20,7 @@ def get_unique_resource_name(name, existing_resources, caller=None):
         str: A unique name for the resource
     """
     # First try to strip any existing number suffix
-    base_name = re.sub(r'[_\s]+\d+$', '', name)
+    base_name = NUMBER_SUFFIX_REGEX.sub('', name)
     
     # If it's a TraitHandler, check if the base name exists
     if hasattr(existing_resources, 'get'):